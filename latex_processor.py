@@ -13,11 +13,21 @@ Example:
     python3 latex_processor.py src/tech-management.tex build/expanded.tex
 """
 
+import mmap
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Matches \input{filename}; compiled once and reused for every included file.
+# Expansion works on raw bytes so pass-through content is never decoded.
+_INPUT_RE = re.compile(rb'\\input\{([^}]+)\}')
+
+# Markers delimiting the auto-generated section of the main LaTeX file
+_BEGIN_MARKER = b'% ========== AUTO-GENERATED CONTENT BEGIN =========='
+_END_MARKER = b'% ========== AUTO-GENERATED CONTENT END =========='
+
 def scan_ideas_directory(ideas_path):
     """
     Scan the ideas directory and return structured data for LaTeX generation.
@@ -28,26 +38,28 @@ def scan_ideas_directory(ideas_path):
     Returns:
         list: List of tuples (part_name, chapters) where chapters is a list of chapter names
     """
-    ideas_dir = Path(ideas_path)
-    if not ideas_dir.exists():
+    if not os.path.exists(ideas_path):
         raise FileNotFoundError(f"Ideas directory not found: {ideas_path}")
     
     parts = []
     
-    # Get all subdirectories (parts) and sort them
-    part_dirs = [d for d in ideas_dir.iterdir() if d.is_dir()]
-    part_dirs.sort(key=lambda x: x.name)
+    # Get all subdirectories (parts) and sort them; scandir entries carry
+    # the file type, so only symlinks need an extra stat call to be resolved
+    with os.scandir(ideas_path) as it:
+        part_dirs = [e for e in it if e.is_dir()]
+    part_dirs.sort(key=lambda e: e.name)
     
     for part_dir in part_dirs:
         part_name = part_dir.name
         chapters = []
         
         # Get all .tex files in this part directory
-        tex_files = [f for f in part_dir.iterdir() if f.is_file() and f.suffix == '.tex']
-        tex_files.sort(key=lambda x: x.name)
+        with os.scandir(part_dir.path) as it:
+            tex_files = [e for e in it if e.is_file() and e.name.endswith('.tex')]
+        tex_files.sort(key=lambda e: e.name)
         
         for tex_file in tex_files:
-            chapter_name = tex_file.stem  # filename without extension
+            chapter_name = tex_file.name[:-4]  # filename without extension
             chapters.append(chapter_name)
         
         if chapters:  # Only add parts that have chapters
@@ -67,19 +79,19 @@ def generate_latex_content(parts):
     Returns:
         str: LaTeX content for parts and chapters only
     """
-    latex_content = []
-    
-    # Generate parts and chapters only (no document header/footer)
-    for part_name, chapters in parts:
-        latex_content.append(f"\\part{{{part_name}}}")
-        
-        for chapter_name in chapters:
-            latex_content.append(f"\\chapter{{{chapter_name}}}")
-            latex_content.append(f"\\input{{ideas/{part_name}/{chapter_name}}}")
-        
-        latex_content.append("")  # Empty line after each part
+    # Generate parts and chapters only (no document header/footer), one
+    # pre-joined block per part with each chapter emitted as a single string
+    part_blocks = [
+        "\n".join([
+            f"\\part{{{part_name}}}",
+            *[f"\\chapter{{{chapter_name}}}\n\\input{{ideas/{part_name}/{chapter_name}}}"
+              for chapter_name in chapters],
+        ])
+        for part_name, chapters in parts
+    ]
     
-    return "\n".join(latex_content)
+    # Empty line between parts, newline after the last one
+    return "\n\n".join(part_blocks) + "\n" if part_blocks else ""
 
 def update_latex_structure(tex_file, ideas_path):
     """
@@ -99,9 +111,6 @@ def update_latex_structure(tex_file, ideas_path):
             print(f"Error: LaTeX file not found at {tex_file}")
             return False
             
-        with open(tex_path, 'r', encoding='utf-8') as f:
-            original_content = f.read()
-        
         # Scan the ideas directory
         parts = scan_ideas_directory(ideas_path)
         
@@ -110,31 +119,51 @@ def update_latex_structure(tex_file, ideas_path):
             return False
         
         # Generate new content section
-        new_content_section = generate_latex_content(parts)
-        
-        # Find the auto-generated content section boundaries
-        # Match everything from BEGIN marker to END marker
-        begin_marker = r'% ========== AUTO-GENERATED CONTENT BEGIN ==========.*?\n'
-        end_marker = r'(% ========== AUTO-GENERATED CONTENT END ==========)'
-        
-        pattern = f'(.*?{begin_marker})(.*?){end_marker}(.*)'
-        match = re.search(pattern, original_content, re.DOTALL)
-        
-        if not match:
+        new_section = generate_latex_content(parts).encode('utf-8') + b"\n\n"
+        
+        # Map the file and find the auto-generated content section boundaries
+        # with plain substring searches on the mapping: the header runs through
+        # the end of the BEGIN marker line, the footer starts at the END marker.
+        # The current section is compared in place; header and footer are only
+        # copied out when the file has to be rewritten.
+        found = unchanged = False
+        header = footer = None
+        with open(tex_path, 'rb') as f:
+            # An empty file cannot be mapped, and has no markers to find anyway
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    header_end = end_start = -1
+                    begin_start = mm.find(_BEGIN_MARKER)
+                    if begin_start != -1:
+                        header_end = mm.find(b'\n', begin_start + len(_BEGIN_MARKER))
+                    if header_end != -1:
+                        end_start = mm.find(_END_MARKER, header_end + 1)
+                    if end_start != -1:
+                        found = True
+                        section_start = header_end + 1
+                        unchanged = (end_start - section_start == len(new_section)
+                                     and mm[section_start:end_start] == new_section)
+                        if not unchanged:
+                            header = mm[:section_start]  # Everything through BEGIN marker line
+                            footer = mm[end_start:]  # END marker and everything after it
+        
+        if not found:
             print("Error: Could not find auto-generated content markers in LaTeX file")
             print("Please ensure the file contains BEGIN and END markers")
             return False
         
-        # Reconstruct the file with new content between markers
-        header = match.group(1)  # Everything before BEGIN marker
-        end_marker = match.group(3)  # The END marker itself
-        footer = match.group(4)  # Everything after END marker
+        # A stable ideas tree regenerates the same section; leave the file
+        # (and its mtime) untouched so make does not see it as changed
+        if unchanged:
+            print(f"LaTeX structure already up to date in {tex_file}")
+            return True
         
+        # Reconstruct the file with new content between markers
         # Ensure we preserve the footer content (like \end{document})
-        updated_content = header + new_content_section + "\n\n" + end_marker + footer
+        updated_content = header + new_section + footer
         
         # Write updated content back to file
-        with open(tex_path, 'w', encoding='utf-8') as f:
+        with open(tex_path, 'wb') as f:
             f.write(updated_content)
         
         print(f"LaTeX structure updated in {tex_file}")
@@ -144,9 +173,91 @@ def update_latex_structure(tex_file, ideas_path):
         print(f"Error updating LaTeX structure: {e}")
         return False
 
-def expand_input(content, base_dir):
+def _read_tex_file(path):
     """
-    Recursively expand \\input{} commands in LaTeX content.
+    Read a LaTeX file as raw bytes.
+    
+    Args:
+        path (str): Path to the file
+        
+    Returns:
+        bytes: File content
+    """
+    with open(path, 'rb') as f:
+        return f.read()
+
+def _resolve_input(input_file, base_dir):
+    """
+    Resolve the file named by an \\input{} command.
+    
+    Args:
+        input_file (str): File name as written in the \\input{} command
+        base_dir (str): Base directory for resolving relative file paths
+        
+    Returns:
+        tuple: (input_file, input_path) where input_file has the .tex
+            extension and input_path is the resolved real path
+    """
+    # Add .tex extension if not present (LaTeX convention)
+    if not input_file.endswith('.tex'):
+        input_file += '.tex'
+    
+    # Resolve file path relative to base directory
+    return input_file, os.path.realpath(os.path.join(base_dir, input_file))
+
+def _input_paths(content, base_dir):
+    """
+    Collect the resolved paths of all files referenced by \\input{} in content.
+    
+    Args:
+        content (bytes): The LaTeX content to scan
+        base_dir (str): Base directory for resolving relative file paths
+        
+    Returns:
+        set: Real paths of the referenced files
+    """
+    return {_resolve_input(match.group(1).decode('utf-8'), base_dir)[1]
+            for match in _INPUT_RE.finditer(content)}
+
+def prefetch_inputs(content, base_dir):
+    """
+    Read all files transitively referenced by \\input{} concurrently.
+    
+    The include tree is walked breadth-first; each level is read in a thread
+    pool so disk latency overlaps. The result is passed to expand_input_iter
+    so it does not read the files serially.
+    
+    Args:
+        content (bytes): The LaTeX content to scan
+        base_dir (str): Base directory for resolving relative file paths
+        
+    Returns:
+        dict: Contents of the readable included files, keyed by real path
+    """
+    prefetched = {}
+    seen = set()
+    pending = _input_paths(content, base_dir)
+    
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        while pending:
+            seen |= pending
+            futures = {path: executor.submit(_read_tex_file, path) for path in pending}
+            pending = set()
+            
+            for path, future in futures.items():
+                try:
+                    input_content = future.result()
+                except OSError:
+                    # Missing files are reported during expansion
+                    continue
+                prefetched[path] = input_content
+                pending |= _input_paths(input_content, base_dir) - seen
+    
+    return prefetched
+
+def expand_input_iter(content, base_dir, prefetched=None):
+    """
+    Recursively expand \\input{} commands in LaTeX content, yielding byte chunks.
     
     This function searches for LaTeX \\input{filename} commands and replaces
     them with the actual content of the referenced files. It handles:
@@ -155,44 +266,61 @@ def expand_input(content, base_dir):
     - Recursive expansion of nested \\input commands
     - Error handling for missing files
     
+    The expanded document is produced piecewise so callers can stream it to
+    disk without holding the whole result in memory.
+    
     Args:
-        content (str): The LaTeX content to process
+        content (bytes): The LaTeX content to process
         base_dir (str): Base directory for resolving relative file paths
+        prefetched (dict): Optional file contents from prefetch_inputs, keyed
+            by real path; files not found there are read from disk
         
-    Returns:
-        str: LaTeX content with all \\input{} commands expanded
+    Yields:
+        bytes: Consecutive chunks of the expanded LaTeX content
+    """
+    # Most chapter files contain no \input at all; skip the regex engine for
+    # them, testing for any backslash first as the cheapest possible check
+    if b'\\' not in content or b'\\input{' not in content:
+        yield content
+        return
+    
+    last = 0
+    for match in _INPUT_RE.finditer(content):
+        yield content[last:match.start()]
+        last = match.end()
+        
+        input_file, input_path = _resolve_input(match.group(1).decode('utf-8'), base_dir)
+        
+        input_content = prefetched.get(input_path) if prefetched else None
+        if input_content is None:
+            # Open directly instead of checking existence first: one syscall, not two.
+            # Only paths that do not exist are reported as not found; other
+            # errors (e.g. permission denied) still fail the run.
+            try:
+                input_content = _read_tex_file(input_path)
+            except (FileNotFoundError, NotADirectoryError):
+                print(f"Warning: File {input_path} not found")
+                yield f"% File not found: {input_file}".encode('utf-8')
+                continue
+        
+        # Recursively expand any \input commands in the included file
+        yield from expand_input_iter(input_content, base_dir, prefetched)
+    
+    yield content[last:]
+
+def expand_input(content, base_dir, prefetched=None):
     """
-    def replace_input(match):
-        """
-        Replace a single \\input{} command with the content of the referenced file.
+    Recursively expand \\input{} commands in LaTeX content.
+    
+    Args:
+        content (bytes): The LaTeX content to process
+        base_dir (str): Base directory for resolving relative file paths
+        prefetched (dict): Optional file contents from prefetch_inputs
         
-        Args:
-            match: Regular expression match object containing the filename
-            
-        Returns:
-            str: Content of the referenced file, or error comment if file not found
-        """
-        input_file = match.group(1)
-        
-        # Add .tex extension if not present (LaTeX convention)
-        if not input_file.endswith('.tex'):
-            input_file += '.tex'
-        
-        # Resolve file path relative to base directory
-        input_path = os.path.join(base_dir, input_file)
-        
-        if os.path.exists(input_path):
-            with open(input_path, 'r', encoding='utf-8') as f:
-                input_content = f.read()
-            # Recursively expand any \input commands in the included file
-            return expand_input(input_content, base_dir)
-        else:
-            print(f"Warning: File {input_path} not found")
-            return f"% File not found: {input_file}"
-    
-    # Replace all \input{filename} with file contents using regex
-    pattern = r'\\input\{([^}]+)\}'
-    return re.sub(pattern, replace_input, content)
+    Returns:
+        bytes: LaTeX content with all \\input{} commands expanded
+    """
+    return b''.join(expand_input_iter(content, base_dir, prefetched))
 
 def main():
     """
@@ -228,18 +356,30 @@ def main():
         base_dir = os.path.dirname(input_file)
         
         # Read the updated LaTeX file
-        with open(input_file, 'r', encoding='utf-8') as f:
+        with open(input_file, 'rb') as f:
             content = f.read()
         
-        # Expand all \input commands recursively
-        expanded_content = expand_input(content, base_dir)
-        
-        # Create output directory if it doesn't exist
-        os.makedirs(os.path.dirname(output_file), exist_ok=True)
-        
-        # Write the expanded content to output file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(expanded_content)
+        # Read all included files up front
+        prefetched = prefetch_inputs(content, base_dir)
+        
+        # Create output directory if it doesn't exist; a single isdir check
+        # avoids makedirs walking the path when it is already there
+        output_dir = os.path.dirname(output_file)
+        if output_dir and not os.path.isdir(output_dir):
+            os.makedirs(output_dir, exist_ok=True)
+        
+        # Expand all \input commands recursively, streaming chunks into a
+        # temporary file next to the output. It only replaces the output once
+        # expansion has finished, so a failure never leaves a truncated file.
+        temp_file = f"{output_file}.tmp"
+        try:
+            with open(temp_file, 'wb') as f:
+                f.writelines(expand_input_iter(content, base_dir, prefetched))
+            os.replace(temp_file, output_file)
+        except BaseException:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+            raise
         
         print(f"LaTeX file expanded and written to {output_file}")
         return 0